@@ -8,34 +8,41 @@ Do NOT refactor unless you understand the reporting contract.
 """
 
 from __future__ import annotations
-import argparse, json, re
+import argparse, io, json, re, sys
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 # -------------------------
 # Helpers
 # -------------------------
+_RE_BLANKS = re.compile(r"\n{3,}")
+_RE_CWE = re.compile(r"/definitions/(\d+)\.html")
+
+_LATEX_TABLE = str.maketrans({
+    "&": r"\&",
+    "%": r"\%",
+    "#": r"\#",
+    #"\\": r"\textbackslash{}",
+    "$": r"\$",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    #"~": r"\textasciitilde{}",
+    #"^": r"\textasciicircum{}",
+})
+
 def latex_escape(s: str) -> str:
-    return (
-        s.replace("&", r"\&")
-         .replace("%", r"\%")
-         .replace("#", r"\#")
-         #.replace("\\", r"\textbackslash{}")
-         .replace("$", r"\$")
-         .replace("_", r"\_")
-         .replace("{", r"\{")
-         .replace("}", r"\}")
-         #.replace("~", r"\textasciitilde{}")
-         #.replace("^", r"\textasciicircum{}")
-    )
+    return s.translate(_LATEX_TABLE)
 
 def render_cwe(cwe_value: str) -> str:
     if not cwe_value:
         return ""
 
     if isinstance(cwe_value, str):
-        m = re.search(r"/definitions/(\d+)\.html", cwe_value)
+        m = _RE_CWE.search(cwe_value)
         if m:
             num = m.group(1)
             return f"**CWE Link:** [CWE-{num}]({cwe_value})\n\n"
@@ -43,56 +50,73 @@ def render_cwe(cwe_value: str) -> str:
     return ""
 
 def latex_fullwidth_table(headers, rows):
-    out = ""
-    out += "```{=latex}\n"
-    out += (
-        "\\begin{tabular*}{\\textwidth}"
-        "{@{\\extracolsep{\\fill}} "
-        + " ".join(["l"] * len(headers)) +
-        "}\n"
-    )
-    out += "\\hline\n"
+    col_spec = " ".join(["l"] * len(headers))
 
-    out += " & ".join(
-        f"\\textbf{{{latex_escape(h)}}}" for h in headers
-    ) + " \\\\\n"
+    hdr_line = " & ".join(f"\\textbf{{{h}}}" for h in map(latex_escape, headers))
 
-    out += "\\hline\n"
-
-    for row in rows:
-        out += " & ".join(
-            latex_escape(str(c)) for c in row
-        ) + " \\\\\n"
+    escaped = [
+        [latex_escape(c) if isinstance(c, str) else latex_escape(str(c)) for c in row]
+        for row in rows
+    ]
 
-    out += "\\hline\n"
-    out += "\\end{tabular*}\n"
-    out += "```\n"
+    parts = [
+        "```{=latex}\n",
+        "\\begin{tabular*}{\\textwidth}"
+        "{@{\\extracolsep{\\fill}} " + col_spec + "}\n",
+        "\\hline\n",
+        hdr_line,
+        " \\\\\n",
+        "\\hline\n",
+    ]
+    if escaped:
+        parts.append("\n".join(" & ".join(r) + " \\\\" for r in escaped))
+        parts.append("\n")
+    parts.append("\\hline\n")
+    parts.append("\\end{tabular*}\n")
+    parts.append("```\n")
 
-    return out
+    return "".join(parts)
 
 def _s(v: Any) -> str:
     if v is None:
         return ""
     return str(v)
 
-def md_escape(v: Any) -> str:
-    s = _s(v)
+_MD_TABLE = str.maketrans({
+    "\\": "\\textbackslash{}",
+    "|": "\\|",
+    "\r": "\n",
+})
+_MD_SPECIAL = frozenset("\\|\r\n")
+
+# Cell values repeat heavily (severities, OS names, Yes/No, hostnames),
+# so the string-level escapers are memoized. The caches are bounded LRUs and
+# are never cleared: the script runs once per report, so nothing needs to.
+@lru_cache(maxsize=4096)
+def _md_escape_str(s: str) -> str:
     if not s:
         return ""
-    s = s.replace("\\", "\\textbackslash{}")
-    s = s.replace("|", "\\|")
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = s.replace("\n", "<br>")
-    return s
+    if _MD_SPECIAL.isdisjoint(s):
+        return s
+    s = s.replace("\r\n", "\n").translate(_MD_TABLE)
+    return s.replace("\n", "<br>")
+
+def md_escape(v: Any) -> str:
+    return _md_escape_str(_s(v))
+
+# Keyed on the first line only, so multi-line source/network blobs
+# never end up held in the cache.
+@lru_cache(maxsize=4096)
+def _compact_line(first: str, max_len: int) -> str:
+    if len(first) > max_len:
+        first = first[: max_len - 1] + "…"
+    return _md_escape_str(first)
 
 def compact_cell(v: Any, max_len: int = 70) -> str:
     s = _s(v).strip()
     if not s:
         return ""
-    first = s.split("\n", 1)[0]
-    if len(first) > max_len:
-        first = first[: max_len - 1] + "…"
-    return md_escape(first)
+    return _compact_line(s.split("\n", 1)[0], max_len)
 
 def safe_title(v: Any, fallback: str) -> str:
     t = _s(v).strip()
@@ -102,34 +126,52 @@ def md_h(title: str, level: int) -> str:
     return f"{'#' * level} {title}\n\n"
 
 def md_table(headers: List[str], rows: List[List[str]]) -> str:
-    out = "| " + " | ".join(headers) + " |\n"
-    out += "| " + " | ".join(["---"] * len(headers)) + " |\n"
+    parts = [
+        "| " + " | ".join(headers) + " |\n",
+        "| " + " | ".join(["---"] * len(headers)) + " |\n",
+    ]
     for r in rows:
-        out += "| " + " | ".join(r) + " |\n"
-    return out + "\n"
+        parts.append("| " + " | ".join(r) + " |\n")
+    parts.append("\n")
+    return "".join(parts)
 
 def md_kv(label: str, value: Any) -> str:
-    if not _s(value).strip():
+    if value is None or value == "":
+        return ""
+    s = value if isinstance(value, str) else str(value)
+    if not s.strip():
         return ""
-    return f"**{label}:** {value}\n\n"
+    return f"**{label}:** {s}\n\n"
 
 def md_block(label: str, value: Any) -> str:
-    v = _s(value).strip()
+    if value is None or value == "":
+        return ""
+    v = (value if isinstance(value, str) else str(value)).strip()
     if not v:
         return ""
     return f"**{label}:**\n\n{v}\n\n"
 
 def md_code_block(label: str, value: Any) -> str:
-    v = _s(value).strip()
+    if value is None or value == "":
+        return ""
+    v = (value if isinstance(value, str) else str(value)).strip()
     if not v:
         return ""
     return f"**{label}:**\n\n```text\n{v}\n```\n\n"
 
 
 def try_float(v: Any) -> Optional[float]:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)) and not isinstance(v, bool):
+        try:
+            return float(v)
+        except OverflowError:
+            pass  # ints beyond float range: the string path yields +/-inf
     try:
-        return float(_s(v))
-    except Exception:
+        s = v if isinstance(v, str) else str(v)
+        return float(s) if s else None
+    except ValueError:
         return None
 
 # -------------------------
@@ -138,6 +180,8 @@ def try_float(v: Any) -> Optional[float]:
 
 @dataclass
 class Node:
+    __slots__ = ("id", "type", "data")
+
     id: str
     type: str
     data: Dict[str, Any]
@@ -148,7 +192,7 @@ def load_nodes(path: Path) -> List[Node]:
     for n in raw.get("nodes", []):
         nodes.append(Node(
             id=_s(n.get("id")),
-            type=_s(n.get("type")).lower(),
+            type=sys.intern(_s(n.get("type")).lower()),
             data=n.get("data") or {}
         ))
     return nodes
@@ -157,8 +201,7 @@ def load_nodes(path: Path) -> List[Node]:
 # Core exporters
 # -------------------------
 
-def export_engagement_overview() -> str:
-    return r"""
+_ENGAGEMENT_OVERVIEW = r"""
 \newpage
 # Engagement Overview
 ## Confidentiality Notice
@@ -194,8 +237,10 @@ Security posture may change over time due to configuration changes, patching, or
 ---
 """.lstrip()
 
-def export_artifacts_overview() -> str:
-    return r"""
+def export_engagement_overview() -> str:
+    return _ENGAGEMENT_OVERVIEW
+
+_ARTIFACTS_OVERVIEW = r"""
 The following artifacts were created as a direct and intentional result of controlled security testing activities conducted during this engagement. 
 These artifacts may include, but are not limited to, temporary files, modified configurations, injected payloads, test credentials, web shells, database entries, 
 or other changes introduced solely to validate the presence and impact of identified security weaknesses.
@@ -216,8 +261,10 @@ and that affected systems be revalidated to confirm that no unauthorized access
 
 """.lstrip()
 
-def export_chain_of_compromise_overview() -> str:
-    return r"""
+def export_artifacts_overview() -> str:
+    return _ARTIFACTS_OVERVIEW
+
+_CHAIN_OVERVIEW = r"""
 
 The Chain of Compromise captures the **identified minimal, coherent path** an external,
 unauthenticated adversary could traverse to achieve full compromise of the environment.
@@ -234,112 +281,123 @@ assessment and remediation prioritization.
 
 """.lstrip()
 
-def export_summary_of_findings(vulns: List[Node]) -> str:
-    out = "\n\\newpage\n# Summary of Findings\n"
-    if not vulns:
-        return out + "_No findings identified._\n\n"
+def export_chain_of_compromise_overview() -> str:
+    return _CHAIN_OVERVIEW
 
-    buckets = {"Critical":0,"High":0,"Medium":0,"Low":0,"Info":0}
-    for v in vulns:
-        cvss = try_float(v.data.get("cvss"))
-        sev = _s(v.data.get("severity")).lower()
+# Severity buckets are addressed by index into this tuple
+_SEVERITY_LABELS = ("Critical", "High", "Medium", "Low", "Info")
+
+# (cvss, lowered severity, node) as produced by _sorted_vulns
+_DecoratedVuln = Tuple[Optional[float], str, Node]
+
+def _sorted_vulns(vulns: List[Node]) -> List[_DecoratedVuln]:
+    # (cvss, lowered severity, node), highest CVSS first; parsed once per vuln
+    decorated = [
+        (try_float(v.data.get("cvss")), _s(v.data.get("severity")).lower(), v)
+        for v in vulns
+    ]
+    decorated.sort(key=lambda t: -(t[0] or -1))
+    return decorated
+
+def export_summary_of_findings(buf: TextIO, sorted_vulns: List[_DecoratedVuln]) -> None:
+    buf.write("\n\\newpage\n# Summary of Findings\n")
+    if not sorted_vulns:
+        buf.write("_No findings identified._\n\n")
+        return
+
+    counts = [0] * len(_SEVERITY_LABELS)
+    for cvss, sev, _ in sorted_vulns:
         if cvss is not None:
-            if cvss >= 9: buckets["Critical"] += 1
-            elif cvss >= 7: buckets["High"] += 1
-            elif cvss >= 4: buckets["Medium"] += 1
-            elif cvss > 0: buckets["Low"] += 1
-            else: buckets["Info"] += 1
+            counts[0 if cvss >= 9 else 1 if cvss >= 7 else 2 if cvss >= 4 else 3 if cvss > 0 else 4] += 1
         else:
-            if "critical" in sev: buckets["Critical"] +=1
-            elif "high" in sev: buckets["High"] += 1
-            elif "medium" in sev: buckets["Medium"] += 1
-            elif "low" in sev: buckets["Low"] += 1
-            else: buckets["Info"] += 1
-
-    out += "## Finding Severity\n"
-    out += latex_fullwidth_table(
-        ["Critical","High","Medium","Low","Info"],
-        [[str(buckets[k]) for k in ["Critical","High","Medium","Low","Info"]]]
-    )
+            counts[0 if "critical" in sev else 1 if "high" in sev else 2 if "medium" in sev else 3 if "low" in sev else 4] += 1
 
-    ordered = sorted(
-        vulns,
-        key=lambda v: -(try_float(v.data.get("cvss")) or -1)
-    )
+    buf.write("## Finding Severity\n")
+    buf.write(latex_fullwidth_table(
+        _SEVERITY_LABELS,
+        [[str(n) for n in counts]]
+    ))
 
+    _md = md_escape
     rows = []
-    for i,v in enumerate(ordered,1):
+    for i,(_, _, v) in enumerate(sorted_vulns,1):
+        d = v.data
         rows.append([
             str(i),
-            md_escape(v.data.get("cvss")),
-            md_escape(v.data.get("severity") or "Unknown"),
-            md_escape(safe_title(v.data.get("type"), "Finding"))
+            _md(d.get("cvss")),
+            _md(d.get("severity") or "Unknown"),
+            _md(safe_title(d.get("type"), "Finding"))
         ])
 
-    out += "## Finding List (CVSS Ordered)\n"
-    out += latex_fullwidth_table(["#","CVSS","Severity","Finding Name"], rows)
-    return out
+    buf.write("## Finding List (CVSS Ordered)\n")
+    buf.write(latex_fullwidth_table(["#","CVSS","Severity","Finding Name"], rows))
 
 from pathlib import Path
 
 EVIDENCE_DIR = Path("Evidence")
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".pdf"}
 
-def export_technical_findings(vulns: List[Node]) -> str:
-    if not vulns:
-        return ""
-
-    out = "\\newpage\n# Technical Findings Details\n"
-
-    ordered = sorted(
-        vulns,
-        key=lambda v: -(try_float(v.data.get("cvss")) or -1)
-    )
-
-    for i, v in enumerate(ordered):
+_EVIDENCE_TMPL = (
+    "**Evidence:**\n\n"
+    "```{{=latex}}\n"
+    "\\IfFileExists{{Evidence/{ev}}}{{%\n"
+    "  \\begin{{center}}\n"
+    "  \\includegraphics[width=0.85\\linewidth,height=0.45\\textheight,keepaspectratio]{{Evidence/{ev}}}\n"
+    "  \\end{{center}}\n"
+    "}}{{%\n"
+    "  \\textit{{{fb}}}\n"
+    "}}\n"
+    "```\n\n"
+)
+
+def _evidence_block(ev: str, fb: str) -> str:
+    return _EVIDENCE_TMPL.format(ev=ev, fb=fb)
+
+def export_technical_findings(buf: TextIO, sorted_vulns: List[_DecoratedVuln]) -> None:
+    if not sorted_vulns:
+        return
+
+    buf.write("\\newpage\n# Technical Findings Details\n")
+
+    for i, (_, _, v) in enumerate(sorted_vulns):
         if i > 0:
-            out += "\\newpage\n"
+            buf.write("\\newpage\n")
 
         d = v.data
         title = safe_title(d.get("type"), "Finding")
 
-        out += md_h(
+        buf.write(md_h(
             f"{title} (CVSS: {d.get('cvss')} / Severity: {d.get('severity')})",
             2
-        )
+        ))
 
-        out += md_kv("CVE", d.get("cve"))
-        out += render_cwe(d.get("cwe"))
-        out += md_block("Affected", d.get("affected"))
-        out += md_block("Description", d.get("description"))
+        buf.write(md_kv("CVE", d.get("cve")))
+        buf.write(render_cwe(d.get("cwe")))
+        buf.write(md_block("Affected", d.get("affected")))
+        buf.write(md_block("Description", d.get("description")))
 
         # ---- Evidence (fixed-size, page-safe) ----
         evidence = _s(d.get("evidence")).strip()
         if evidence:
-            out += "**Evidence:**\n\n"
-            out += (
-                "```{=latex}\n"
-                "\\IfFileExists{Evidence/" + evidence + "}{%\n"
-                "  \\begin{center}\n"
-                "  \\includegraphics[width=0.85\\linewidth,height=0.45\\textheight,keepaspectratio]{Evidence/" + evidence + "}\n"
-                "  \\end{center}\n"
-                "}{%\n"
-                "  \\textit{This finding did not require supporting evidence beyond validation during testing.}\n"
-                "}\n"
-                "```\n\n"
-            )
+            buf.write(_evidence_block(
+                evidence,
+                "This finding did not require supporting evidence beyond validation during testing.",
+            ))
         # -----------------------------------------
 
-        out += md_block("Impact", d.get("impact"))
-        out += md_code_block("Exploit / Reproduction", d.get("exploit"))
-        out += md_block("Remediation", d.get("remediation"))
-        out += "\n\n"
+        buf.write(md_block("Impact", d.get("impact")))
+        buf.write(md_code_block("Exploit / Reproduction", d.get("exploit")))
+        buf.write(md_block("Remediation", d.get("remediation")))
+        buf.write("\n\n")
+
 
-    return out
 
+def export_appendices(buf: TextIO, hosts, creds, hashes, flags, webs, sqls, zones) -> None:
+    buf.write("\\newpage\n# Appendices\n")
 
-def export_appendices(hosts, creds, hashes, flags, webs, sqls, zones) -> str:
-    out = "\\newpage\n# Appendices\n"
+    # Local aliases for the per-row escapers used in the table loops below
+    _md = md_escape
+    _cc = compact_cell
 
     appendix_ord = ord("A")
 
@@ -353,14 +411,14 @@ def export_appendices(hosts, creds, hashes, flags, webs, sqls, zones) -> str:
     # Appendix A — Severities (ALWAYS PRESENT)
     # =====================================================
     label = next_label()
-    out += f"\n## Appendix {label} - Severity Ratings Explained\n\n"
-    out += (
+    buf.write(f"\n## Appendix {label} - Severity Ratings Explained\n\n")
+    buf.write(
         "Each finding has been assigned a severity rating based on the "
         "potential business impact and the likelihood of exploitation. "
         "The table below explains each severity level in non-technical terms.\n\n"
     )
 
-    out += latex_fullwidth_table(
+    buf.write(latex_fullwidth_table(
         ["Severity", "Description"],
         [
             [
@@ -384,15 +442,15 @@ def export_appendices(hosts, creds, hashes, flags, webs, sqls, zones) -> str:
                 "Informational finding that does not directly pose a security risk but may aid attackers.",
             ],
         ],
-    )
+    ))
 
     # =====================================================
     # Summary of Identified Objects (ALWAYS PRESENT)
     # =====================================================
     label = next_label()
-    out += f"\n## Appendix {label} - Summary of Identified Objects\n"
+    buf.write(f"\n## Appendix {label} - Summary of Identified Objects\n")
 
-    out += (
+    buf.write(
         "```{=latex}\n"
         "\\begin{tabular*}{\\textwidth}{@{\\extracolsep{\\fill}} l r}\n"
         "\\hline\n"
@@ -411,9 +469,9 @@ def export_appendices(hosts, creds, hashes, flags, webs, sqls, zones) -> str:
     ]
 
     for name, collection in rows:
-        out += f"{name} & {len(collection)} \\\\\n"
+        buf.write(f"{name} & {len(collection)} \\\\\n")
 
-    out += (
+    buf.write(
         "\\hline\n"
         "\\end{tabular*}\n"
         "```\n"
@@ -425,187 +483,189 @@ def export_appendices(hosts, creds, hashes, flags, webs, sqls, zones) -> str:
     # =====================================================
     if hosts:
         label = next_label()
-        out += f"\\newpage\n## Appendix {label} - Exploited Hosts\n"
+        buf.write(f"\\newpage\n## Appendix {label} - Exploited Hosts\n")
         rows = []
         for i, h in enumerate(hosts, 1):
             d = h.data
             rows.append([
                 str(i),
-                md_escape(d.get("hostname")),
-                md_escape(d.get("os")),
-                compact_cell(d.get("network"))
+                _md(d.get("hostname")),
+                _md(d.get("os")),
+                _cc(d.get("network"))
             ])
-        out += latex_fullwidth_table(["#", "Hostname", "OS", "Network"], rows)
+        buf.write(latex_fullwidth_table(["#", "Hostname", "OS", "Network"], rows))
 
     # =====================================================
     # Exploited Infrastructure
     # =====================================================
     if webs or sqls:
         label = next_label()
-        out += f"\\newpage\n## Appendix {label} - Exploited Infrastructure\n"
+        buf.write(f"\\newpage\n## Appendix {label} - Exploited Infrastructure\n")
+        idx = 0
         rows = []
 
         for w in webs:
+            idx += 1
             d = w.data
             rows.append([
-                str(len(rows) + 1),
+                str(idx),
                 "WEB",
-                md_escape(d.get("hostname") or d.get("url")),
-                md_escape(d.get("ip"))
+                _md(d.get("hostname") or d.get("url")),
+                _md(d.get("ip")),
+                "",
             ])
 
         for s in sqls:
+            idx += 1
             d = s.data
             rows.append([
-                str(len(rows) + 1),
+                str(idx),
                 "SQL",
-                md_escape(d.get("hostname")),
-                md_escape(d.get("ip")),
-                compact_cell(d.get("type"))
+                _md(d.get("hostname")),
+                _md(d.get("ip")),
+                _cc(d.get("type")),
             ])
 
-        out += latex_fullwidth_table(["#", "Type", "Name", "IP"], rows)
+        buf.write(latex_fullwidth_table(["#", "Type", "Name", "IP", "Details"], rows))
 
     # =====================================================
     # Credentials Summary
     # =====================================================
     if creds:
         label = next_label()
-        out += f"\\newpage\n## Appendix {label} - Credentials Summary\n"
+        buf.write(f"\\newpage\n## Appendix {label} - Credentials Summary\n")
         rows = []
         for i, c in enumerate(creds, 1):
             d = c.data
             rows.append([
                 str(i),
-                md_escape(d.get("privilege")),
-                md_escape(d.get("username")),
-                md_escape(d.get("password")),
+                _md(d.get("privilege")),
+                _md(d.get("username")),
+                _md(d.get("password")),
             ])
-        out += latex_fullwidth_table(
+        buf.write(latex_fullwidth_table(
             ["#", "Privilege", "Username", "Password"],
             rows,
-        )
+        ))
 
     # =====================================================
     # Hashes Summary
     # =====================================================
     if hashes:
         label = next_label()
-        out += f"\\newpage\n## Appendix {label} - Hashes Summary\n"
+        buf.write(f"\\newpage\n## Appendix {label} - Hashes Summary\n")
         rows = []
         for i, h in enumerate(hashes, 1):
             d = h.data
             rows.append([
                 str(i),
-                md_escape(d.get("type")),
-                md_escape(d.get("algorithm")),
+                _md(d.get("type")),
+                _md(d.get("algorithm")),
                 "Yes" if d.get("password") else "No",
-                md_escape(d.get("target")),
-                compact_cell(d.get("source")),
+                _md(d.get("target")),
+                _cc(d.get("source")),
             ])
-        out += latex_fullwidth_table(
+        buf.write(latex_fullwidth_table(
             ["#", "Type", "Algorithm", "Cracked", "Target", "Source"],
             rows,
-        )
+        ))
 
     # =====================================================
     # Flags Captured
     # =====================================================
     if flags:
         label = next_label()
-        out += f"\\newpage\n## Appendix {label} - Flags Captured\n"
+        buf.write(f"\\newpage\n## Appendix {label} - Flags Captured\n")
         rows = []
         for i, f in enumerate(flags, 1):
             d = f.data
             rows.append([
                 str(i),
-                md_escape(d.get("value")),
-                compact_cell(d.get("source")),
+                _md(d.get("value")),
+                _cc(d.get("source")),
             ])
-        out += latex_fullwidth_table(["#", "Flag", "Source"], rows)
+        buf.write(latex_fullwidth_table(["#", "Flag", "Source"], rows))
 
-    return out
 
-def export_artifacts_cleanup(artifacts: List[Node]) -> str:
+def export_artifacts_cleanup(buf: TextIO, artifacts: List[Node]) -> None:
     if not artifacts:
-        return ""
+        return
 
-    out = "\n\\newpage\n# Artifacts / Cleanup\n\n"
+    buf.write("\n\\newpage\n# Artifacts / Cleanup\n\n")
 
-    out += export_artifacts_overview()
+    buf.write(export_artifacts_overview())
 
     for a in artifacts:
         d = a.data
 
+        typ = d.get("type")
+        typ_s = _s(typ).strip()
+        location = d.get("location")
+        location_s = _s(location).strip()
+
         title_parts = []
-        if _s(d.get("type")).strip():
-            title_parts.append(_s(d.get("type")).strip())
-        if _s(d.get("location")).strip():
-            title_parts.append(_s(d.get("location")).strip())
+        if typ_s:
+            title_parts.append(typ_s)
+        if location_s:
+            title_parts.append(location_s)
 
         title = " - ".join(title_parts) if title_parts else "Unnamed Artifact"
-        out += f"\n\\newpage\n## Artifact: {md_escape(title)}\n\n"
+        buf.write(f"\n\\newpage\n## Artifact: {md_escape(title)}\n\n")
 
-        out += md_block("Type", d.get("type"))
-        out += md_block("Location", d.get("location"))
-        out += md_block("Purpose", d.get("purpose"))
-        out += md_block("Cleanup", d.get("cleanup"))
-                # ---- Evidence (fixed-size, page-safe) ----
+        buf.write(md_block("Type", typ))
+        buf.write(md_block("Location", location))
+        buf.write(md_block("Purpose", d.get("purpose")))
+        buf.write(md_block("Cleanup", d.get("cleanup")))
+        # ---- Evidence (fixed-size, page-safe) ----
         evidence = _s(d.get("evidence")).strip()
         if evidence:
-            out += "**Evidence:**\n\n"
-            out += (
-                "```{=latex}\n"
-                "\\IfFileExists{Evidence/" + evidence + "}{%\n"
-                "  \\begin{center}\n"
-                "  \\includegraphics[width=0.85\\linewidth,height=0.45\\textheight,keepaspectratio]{Evidence/" + evidence + "}\n"
-                "  \\end{center}\n"
-                "}{%\n"
-                "  \\textit{This artifact did not require supporting evidence beyond validation during testing.}\n"
-                "}\n"
-                "```\n\n"
-            )
+            buf.write(_evidence_block(
+                evidence,
+                "This artifact did not require supporting evidence beyond validation during testing.",
+            ))
         # -----------------------------------------
-        out += md_kv("Created By", d.get("created_by"))
-        out += md_block("Notes", d.get("notes"))
+        buf.write(md_kv("Created By", d.get("created_by")))
+        buf.write(md_block("Notes", d.get("notes")))
 
-        out += "\n\n"
+        buf.write("\n\n")
 
-    return out
 
 # -------------------------
 # Build report
 # -------------------------
 
-def build_report(hosts, vulns, creds, hashes, artifacts, flags, webs, sqls, zones) -> str:
-    out = ""
+def build_report(buf: TextIO, hosts, vulns, creds, hashes, artifacts, flags, webs, sqls, zones) -> None:
+    # Writes the raw report into buf and returns nothing. Runs of 3+ newlines
+    # are NOT collapsed here; callers apply _RE_BLANKS to buf.getvalue() (see main).
+    # Parsed and CVSS-sorted once, shared by the summary and technical findings
+    ordered = _sorted_vulns(vulns)
+
     # Metadata
-    out += "---\nheader-includes:\n- \\usepackage{graphicx}\n---\n"
-    out += "---\ntitle: Penetration Test Report\nauthor: Petar Georgiev\ndate: 2025-12-13\n---"
+    buf.write("---\nheader-includes:\n- \\usepackage{graphicx}\n---\n")
+    buf.write("---\ntitle: Penetration Test Report\nauthor: Petar Georgiev\ndate: 2025-12-13\n---")
 
     # 1. Engagement Overview (Boilerplate)
-    out += "\n"
-    out += export_engagement_overview()
+    buf.write("\n")
+    buf.write(export_engagement_overview())
     
     # 2. Summary of Findings
-    out += export_summary_of_findings(vulns)
+    export_summary_of_findings(buf, ordered)
     
     # 3. Executive Summary
-    out += "\\newpage\n# Executive Summary\nPLACEHOLDER FOR ANTARES\n\n"
+    buf.write("\\newpage\n# Executive Summary\nPLACEHOLDER FOR ANTARES\n\n")
 
     # 4. Chain of Compromise
-    out += "\\newpage\n# Chain of Compromise\n"
-    out += export_chain_of_compromise_overview()
-    out += "PLACEHOLDER FOR ANTARES\n\n"
+    buf.write("\\newpage\n# Chain of Compromise\n")
+    buf.write(export_chain_of_compromise_overview())
+    buf.write("PLACEHOLDER FOR ANTARES\n\n")
 
     # 5. Remediation Summary
-    out += "\\newpage\n# Remediation Summary\nPLACEHOLDER FOR ANTARES\n\n"
+    buf.write("\\newpage\n# Remediation Summary\nPLACEHOLDER FOR ANTARES\n\n")
     
     # 6. Appendices
-    out += export_technical_findings(vulns)
-    out += export_appendices(hosts, creds, hashes, flags, webs, sqls, zones)
-    out += export_artifacts_cleanup(artifacts)
-    return re.sub(r"\n{3,}", "\n\n", out)
+    export_technical_findings(buf, ordered)
+    export_appendices(buf, hosts, creds, hashes, flags, webs, sqls, zones)
+    export_artifacts_cleanup(buf, artifacts)
 
 # -------------------------
 # Main
@@ -618,19 +678,29 @@ def main():
     args = ap.parse_args()
 
     nodes = load_nodes(args.json)
-    hosts=[n for n in nodes if n.type=="host"]
-    vulns=[n for n in nodes if n.type=="vuln"]
-    creds=[n for n in nodes if n.type=="credential"]
-    hashes=[n for n in nodes if n.type=="hash"]
-    artifacts=[n for n in nodes if n.type=="artifact"]
-    flags=[n for n in nodes if n.type=="flag"]
-    webs=[n for n in nodes if n.type=="webapp"]
-    sqls=[n for n in nodes if n.type=="database"]
-    zones=[n for n in nodes if n.type=="zone"]
-
-    report = build_report(hosts,vulns,creds,hashes,artifacts,flags,webs,sqls,zones)
-    args.out.write_text(report, encoding="utf-8")
-    print(f"Wrote {args.out}")
+    buckets = defaultdict(list)
+    for n in nodes:
+        buckets[n.type].append(n)
+    hosts=buckets["host"]
+    vulns=buckets["vuln"]
+    creds=buckets["credential"]
+    hashes=buckets["hash"]
+    artifacts=buckets["artifact"]
+    flags=buckets["flag"]
+    webs=buckets["webapp"]
+    sqls=buckets["database"]
+    zones=buckets["zone"]
+
+    buf = io.StringIO()
+    build_report(buf,hosts,vulns,creds,hashes,artifacts,flags,webs,sqls,zones)
+    raw = buf.getvalue()
+    buf.close()
+    report = _RE_BLANKS.sub("\n\n", raw)
+    del raw
+    data = report.encode("utf-8")
+    del report
+    args.out.write_bytes(data)
+    print(f"Wrote {args.out} ({len(data)} bytes)")
 
 if __name__ == "__main__":
     main()